@@ -297,27 +297,24 @@ class ChainEventGraph(nx.MultiDiGraph):
 
     def _update_distances_to_sink(self) -> None:
         """
-        Iterates through the graph until it finds the root node.
-        For each node, it determines the maximum number of edges
-        from that node to the sink node.
+        For each node, determines the maximum number of edges from that
+        node to the sink node.
+
+        The graph is a DAG, so the distances are found with a single
+        dynamic-programming pass over the nodes in reverse topological
+        order, visiting each node and edge once.
         """
         max_dist = "max_dist_to_sink"
         self.nodes[self.sink][max_dist] = 0
-        node_queue = [self.sink]
-
-        while node_queue != [self.root]:
-            node = node_queue.pop(0)
-            for pred in self.predecessors(node):
-                max_dist_to_sink = set()
-                for succ in self.successors(pred):
-                    try:
-                        max_dist_to_sink.add(self.nodes[succ][max_dist])
-                        self.nodes[pred][max_dist] = max(max_dist_to_sink) + 1
-                    except KeyError:
-                        break
 
-                if pred not in node_queue:
-                    node_queue.append(pred)
+        for node in nx.topological_sort(self.reverse(copy=False)):
+            succ_dists = [
+                self.nodes[succ][max_dist]
+                for succ in self.successors(node)
+                if max_dist in self.nodes[succ]
+            ]
+            if succ_dists:
+                self.nodes[node][max_dist] = max(succ_dists) + 1
 
     def _gen_nodes_with_increasing_distance(self, start=0) -> list:
         """Generates nodes that are either the same or further
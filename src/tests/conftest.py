@@ -0,0 +1,37 @@
+"""Shared helpers for the test suite."""
+import os
+import tempfile
+from pathlib import Path
+import pandas as pd
+
+
+def load_dataframe(df_path: Path) -> pd.DataFrame:
+    """Reads a test spreadsheet through a parquet cache.
+
+    The xlsx file is parsed once and cached next to it as parquet;
+    subsequent reads use the much faster columnar format. The cache is
+    written to a temp file and moved into place atomically, so
+    concurrent xdist workers never see a half-written file. Any failure
+    to write or read the cache falls back to a plain excel read.
+    """
+    cache = df_path.with_suffix(".parquet")
+    if not cache.exists():
+        dataframe = pd.read_excel(df_path)
+        try:
+            handle, tmp_path = tempfile.mkstemp(
+                suffix=".parquet", dir=df_path.parent
+            )
+            os.close(handle)
+            try:
+                dataframe.to_parquet(tmp_path)
+                os.replace(tmp_path, cache)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+        except (ImportError, OSError):
+            pass
+        return dataframe
+    try:
+        return pd.read_parquet(cache)
+    except Exception:  # pylint: disable=broad-except
+        return pd.read_excel(df_path)
@@ -1,17 +1,35 @@
 """Tests ChainEventGraph"""
 # pylint: disable=protected-access
+import copy
+import functools
+import random
 import re
 from pathlib import Path
 from typing import Dict, Mapping
 import unittest
 from unittest.mock import Mock, patch
 import networkx as nx
-import pandas as pd
+import pytest
 from cegpy import StagedTree, ChainEventGraph
 from cegpy.graphs._ceg import (
     CegAlreadyGenerated,
     _merge_edge_data,
 )
+from tests.conftest import load_dataframe
+
+_NODE_RE = re.compile(r"^w(?:\d+|_infinity)$")
+
+_DF_PATH = (
+    Path(__file__).resolve().parent.parent.joinpath("../data/medical_dm_modified.xlsx")
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _staged_tree_template() -> StagedTree:
+    """Reads the data and runs AHC once per test session."""
+    staged = StagedTree(dataframe=load_dataframe(_DF_PATH))
+    staged.calculate_AHC_transitions()
+    return staged
 
 
 class TestMockedCEGMethods(unittest.TestCase):
@@ -23,14 +41,7 @@ class TestMockedCEGMethods(unittest.TestCase):
 
     def setUp(self):
         """Test setup"""
-        df_path = (
-            Path(__file__)
-            .resolve()
-            .parent.parent.joinpath("../data/medical_dm_modified.xlsx")
-        )
-
-        self.staged = StagedTree(dataframe=pd.read_excel(df_path))
-        self.staged.calculate_AHC_transitions()
+        self.staged = copy.deepcopy(_staged_tree_template())
 
     @patch("cegpy.graphs._ceg.ChainEventGraph.generate", autospec=True)
     def test_generate_argument(self, generate_mock: Mock):
@@ -46,14 +57,7 @@ class TestUnitCEG(unittest.TestCase):
     def setUp(self):
         self.node_prefix = "w"
         self.sink_suffix = "&infin;"
-        df_path = (
-            Path(__file__)
-            .resolve()
-            .parent.parent.joinpath("../data/medical_dm_modified.xlsx")
-        )
-
-        self.staged = StagedTree(dataframe=pd.read_excel(df_path))
-        self.staged.calculate_AHC_transitions()
+        self.staged = copy.deepcopy(_staged_tree_template())
 
     def test_stages_property(self):
         """Stages is a mapping of stage names to lists of nodes"""
@@ -77,91 +81,78 @@ class TestUnitCEG(unittest.TestCase):
             assert ceg.create_figure() is None
 
 
-class TestCEGHelpersTestCases(unittest.TestCase):
-    """Tests some of the CEG helper functions."""
-
-    def setUp(self):
-        self.graph = nx.MultiDiGraph()
-        self.init_nodes = ["w0", "w1", "w2", "w3", "w4", "w_infinity"]
-        self.init_edges = [
-            ("w0", "w1", "a"),
-            ("w0", "w2", "b"),
-            ("w1", "w3", "c"),
-            ("w1", "w4", "d"),
-            ("w2", "w3", "c"),
-            ("w2", "w4", "d"),
-            ("w3", "w_infinity", "e"),
-            ("w4", "w_infinity", "f"),
-        ]
-        self.graph.root = "w0"
-        self.graph.add_nodes_from(self.init_nodes)
-        self.graph.add_edges_from(self.init_edges)
-        self.ceg = ChainEventGraph(self.graph, generate=False)
+class TestMergeEdgeData(unittest.TestCase):
+    """Tests the _merge_edge_data helper, which needs no graph fixture."""
 
     def test_merge_edge_data(self):
         """Edges are merged"""
-        edge_1 = dict(
-            zip(
-                ["count", "prior", "posterior", "probability"],
-                [250, 0.5, 250, 0.8],
-            )
-        )
-        edge_2 = dict(
-            zip(
-                ["count", "prior", "posterior", "probability"],
-                [550, 25, 0.4, 0.9],
-            )
-        )
+        edge_1 = {
+            "count": 250,
+            "prior": 0.5,
+            "posterior": 250,
+            "probability": 0.8,
+        }
+        edge_2 = {
+            "count": 550,
+            "prior": 25,
+            "posterior": 0.4,
+            "probability": 0.9,
+        }
 
         new_edge_dict = _merge_edge_data(edge_1=edge_1, edge_2=edge_2)
         self.assert_edges_merged(new_edge_dict, edge_1, edge_2)
 
     def test_merge_edge_data_with_missing(self):
         """Edges are merged even when some data is missing in one edge."""
-        edge_1 = dict(
-            zip(
-                ["count", "prior"],
-                [250, 0.5],
-            )
-        )
-        edge_2 = dict(
-            zip(
-                ["count", "prior", "posterior"],
-                [550, 25, 0.4],
-            )
-        )
+        edge_1 = {"count": 250, "prior": 0.5}
+        edge_2 = {"count": 550, "prior": 25, "posterior": 0.4}
 
         new_edge_dict = _merge_edge_data(edge_1=edge_1, edge_2=edge_2)
         self.assert_edges_merged(new_edge_dict, edge_1, edge_2)
 
     def assert_edges_merged(self, new_edge: Dict, edge_1: Dict, edge_2: Dict):
         """Edges were merged successfully."""
+        expected = {
+            key: (
+                # Probability shouldn't be summed.
+                edge_1.get(key, edge_2.get(key))
+                if key == "probability"
+                else edge_1.get(key, 0) + edge_2.get(key, 0)
+            )
+            for key in edge_1.keys() | edge_2.keys()
+        }
+        self.assertEqual(new_edge, expected, msg="Edges not merged correctly.")
 
-        self.assertSetEqual(
-            set(new_edge.keys()),
-            set(edge_1.keys()).union(set(edge_2.keys())),
-            msg="Edges do not have the same keys.",
-        )
 
-        for key, value in new_edge.items():
-            if key == "probability":
-                self.assertEqual(
-                    value, edge_1.get(key), msg="Probability shouldn't be summed."
-                )
-            else:
-                self.assertEqual(
-                    value,
-                    (edge_1.get(key, 0) + edge_2.get(key, 0)),
-                    msg=f"{key} not merged. Merged value: {value}",
-                )
+class TestCEGHelpersTestCases(unittest.TestCase):
+    """Tests the CEG helper methods that operate on a graph."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Builds the template graph once for the whole class."""
+        cls._template_graph = nx.MultiDiGraph()
+        cls.init_edges = [
+            ("w0", "w1", "a"),
+            ("w0", "w2", "b"),
+            ("w1", "w3", "c"),
+            ("w1", "w4", "d"),
+            ("w2", "w3", "c"),
+            ("w2", "w4", "d"),
+            ("w3", "w_infinity", "e"),
+            ("w4", "w_infinity", "f"),
+        ]
+        cls._template_graph.add_edges_from(cls.init_edges)
+
+    def setUp(self):
+        self.graph = self._template_graph.copy()
+        self.graph.root = "w0"
+        self.ceg = ChainEventGraph(self.graph, generate=False)
 
     def test_relabel_nodes(self):
         """Relabel nodes successfully renames all the nodes."""
         self.ceg._relabel_nodes()
-        node_pattern = r"^w([0-9]+)|w(_infinity)$"
-        prog = re.compile(node_pattern)
         for node in self.ceg.nodes:
-            result = prog.match(node)
+            result = _NODE_RE.match(node)
             assert result is not None, "Node does not match expected format."
 
     def test_merge_outgoing_edges(self):
@@ -224,118 +215,99 @@ class TestCEGHelpersTestCases(unittest.TestCase):
 
         expected = [(edge["src"], edge["dst"], edge["key"]) for edge in edges_to_add]
         actual = self.ceg._merge_and_add_edges("s99", "s1", "s2")
-        for edge in expected:
-            assert (
-                edge in actual
-            ), f"Expected {edge} in return value, but it was not found."
-        assert len(expected) == len(
-            actual
-        ), "Actual number of edges does not match expected number of edges."
+        self.assertCountEqual(
+            expected,
+            actual,
+            "Returned edges do not match the expected edges.",
+        )
 
 
-class TestNodesCanBeMerged(unittest.TestCase):
+_BASE_EDGES = [
+    ("w0", "w1", "a"),
+    ("w0", "w2", "b"),
+    ("w1", "w3", "c"),
+    ("w1", "w4", "d"),
+    ("w2", "w3", "c"),
+    ("w2", "w4", "d"),
+    ("w3", "w_infinity", "e"),
+    ("w4", "w_infinity", "f"),
+]
+
+_DIFFERENT_SUCCESSOR_EDGES = [
+    ("w0", "w1", "a"),
+    ("w0", "w2", "b"),
+    ("w1", "w3", "c"),
+    ("w1", "w4", "d"),
+    ("w2", "w_infinity", "c"),
+    ("w2", "w4", "d"),
+    ("w3", "w_infinity", "e"),
+    ("w4", "w_infinity", "f"),
+]
+
+_DIFFERENT_OUTGOING_EDGES = [
+    ("w0", "w1", "a"),
+    ("w0", "w2", "b"),
+    ("w1", "w3", "c"),
+    ("w1", "w4", "d"),
+    ("w2", "w3", "g"),
+    ("w2", "w4", "d"),
+    ("w3", "w_infinity", "e"),
+    ("w4", "w_infinity", "f"),
+]
+
+
+class TestNodesCanBeMerged:
     """Tests nodes_can_be_merged() function."""
 
-    def setUp(self):
-        self.graph = nx.MultiDiGraph()
-        self.init_nodes = ["w0", "w1", "w2", "w3", "w4", "w_infinity"]
-        self.graph.root = "w0"
-        self.graph.add_nodes_from(self.init_nodes)
-
-    def test_check_nodes_can_be_merged(self):
-        """Nodes can be merged."""
-        init_edges = [
-            ("w0", "w1", "a"),
-            ("w0", "w2", "b"),
-            ("w1", "w3", "c"),
-            ("w1", "w4", "d"),
-            ("w2", "w3", "c"),
-            ("w2", "w4", "d"),
-            ("w3", "w_infinity", "e"),
-            ("w4", "w_infinity", "f"),
-        ]
-        self.graph.add_edges_from(init_edges)
-        ceg = ChainEventGraph(self.graph, generate=False)
-        ceg.nodes["w1"]["stage"] = 2
-        ceg.nodes["w2"]["stage"] = 2
-        assert ceg._check_nodes_can_be_merged("w1", "w2"), "Nodes should be mergeable."
-
-    def test_nodes_not_in_same_stage_cannot_be_merged(self):
-        """Nodes not in same stage cannot be merged"""
-        init_edges = [
-            ("w0", "w1", "a"),
-            ("w0", "w2", "b"),
-            ("w1", "w3", "c"),
-            ("w1", "w4", "d"),
-            ("w2", "w3", "c"),
-            ("w2", "w4", "d"),
-            ("w3", "w_infinity", "e"),
-            ("w4", "w_infinity", "f"),
-        ]
-        self.graph.add_edges_from(init_edges)
-        ceg = ChainEventGraph(self.graph, generate=False)
-        ceg.nodes["w1"]["stage"] = 1
-        ceg.nodes["w2"]["stage"] = 2
-        assert not ceg._check_nodes_can_be_merged(
-            "w1", "w2"
-        ), "Nodes should not be mergeable."
-
-    def test_nodes_with_different_successor_nodes(self):
-        """Nodes with different successor nodes won't be merged."""
-        init_edges = [
-            ("w0", "w1", "a"),
-            ("w0", "w2", "b"),
-            ("w1", "w3", "c"),
-            ("w1", "w4", "d"),
-            ("w2", "w_infinity", "c"),
-            ("w2", "w4", "d"),
-            ("w3", "w_infinity", "e"),
-            ("w4", "w_infinity", "f"),
-        ]
-        self.graph.add_edges_from(init_edges)
-        ceg = ChainEventGraph(self.graph, generate=False)
-        ceg.nodes["w1"]["stage"] = 2
-        ceg.nodes["w2"]["stage"] = 2
-        assert not ceg._check_nodes_can_be_merged(
-            "w1", "w2"
-        ), "Nodes should not be mergeable."
-
-    def test_nodes_with_different_outgoing_edges(self):
-        """Nodes with different outgoing edges won't be merged."""
-        init_edges = [
-            ("w0", "w1", "a"),
-            ("w0", "w2", "b"),
-            ("w1", "w3", "c"),
-            ("w1", "w4", "d"),
-            ("w2", "w3", "g"),
-            ("w2", "w4", "d"),
-            ("w3", "w_infinity", "e"),
-            ("w4", "w_infinity", "f"),
-        ]
-        self.graph.add_edges_from(init_edges)
-        ceg = ChainEventGraph(self.graph, generate=False)
-        ceg.nodes["w1"]["stage"] = 2
-        ceg.nodes["w2"]["stage"] = 2
-        assert not ceg._check_nodes_can_be_merged(
-            "w1", "w2"
-        ), "Nodes should not be mergeable."
+    @pytest.fixture
+    def graph(self):
+        """A fresh graph for each test; the edges create every node."""
+        graph = nx.MultiDiGraph()
+        graph.root = "w0"
+        return graph
+
+    @pytest.mark.parametrize(
+        "init_edges, stages, expected",
+        [
+            pytest.param(
+                _BASE_EDGES,
+                {"w1": 2, "w2": 2},
+                True,
+                id="same_stage_and_edges",
+            ),
+            pytest.param(
+                _BASE_EDGES,
+                {"w1": 1, "w2": 2},
+                False,
+                id="not_in_same_stage",
+            ),
+            pytest.param(
+                _DIFFERENT_SUCCESSOR_EDGES,
+                {"w1": 2, "w2": 2},
+                False,
+                id="different_successor_nodes",
+            ),
+            pytest.param(
+                _DIFFERENT_OUTGOING_EDGES,
+                {"w1": 2, "w2": 2},
+                False,
+                id="different_outgoing_edges",
+            ),
+        ],
+    )
+    def test_check_nodes_can_be_merged(self, graph, init_edges, stages, expected):
+        """Nodes are mergeable only when they share a stage, successor
+        nodes, and outgoing edge labels."""
+        graph.add_edges_from(init_edges)
+        ceg = ChainEventGraph(graph, generate=False)
+        nx.set_node_attributes(ceg, stages, "stage")
+        assert ceg._check_nodes_can_be_merged("w1", "w2") is expected
 
-    def test_merging_of_nodes(self):
+    def test_merging_of_nodes(self, graph):
         """The nodes are merged, and all edges are merged too."""
-        init_edges = [
-            ("w0", "w1", "a"),
-            ("w0", "w2", "b"),
-            ("w1", "w3", "c"),
-            ("w1", "w4", "d"),
-            ("w2", "w3", "c"),
-            ("w2", "w4", "d"),
-            ("w3", "w_infinity", "e"),
-            ("w4", "w_infinity", "f"),
-        ]
-        self.graph.add_edges_from(init_edges)
-        ceg = ChainEventGraph(self.graph, generate=False)
-        ceg.nodes["w1"]["stage"] = 2
-        ceg.nodes["w2"]["stage"] = 2
+        graph.add_edges_from(_BASE_EDGES)
+        ceg = ChainEventGraph(graph, generate=False)
+        nx.set_node_attributes(ceg, {"w1": 2, "w2": 2}, "stage")
         ceg._merge_nodes([("w1", "w2")])
         expected_edges = [
             ("w0", "w1", "a"),
@@ -345,12 +317,12 @@ class TestNodesCanBeMerged(unittest.TestCase):
             ("w3", "w_infinity", "e"),
             ("w4", "w_infinity", "f"),
         ]
+        actual_edges = set(ceg.edges)
         for edge in expected_edges:
-            self.assertIn(edge, list(ceg.edges))
+            assert edge in actual_edges, f"Edge not found: {edge}"
 
-    def test_merging_of_three_nodes(self):
+    def test_merging_of_three_nodes(self, graph):
         """The three nodes are merged, and all edges are merged too."""
-        self.graph.add_node("w5")
         init_edges = [
             ("w0", "w1", "a"),
             ("w0", "w2", "b"),
@@ -364,13 +336,11 @@ class TestNodesCanBeMerged(unittest.TestCase):
             ("w4", "w_infinity", "f"),
             ("w5", "w_infinity", "g"),
         ]
-        self.graph.add_edges_from(init_edges)
-        ceg = ChainEventGraph(self.graph, generate=False)
+        graph.add_edges_from(init_edges)
+        ceg = ChainEventGraph(graph, generate=False)
 
         nodes_to_merge = {"w1", "w2", "w3"}
-        ceg.nodes["w1"]["stage"] = 2
-        ceg.nodes["w2"]["stage"] = 2
-        ceg.nodes["w3"]["stage"] = 2
+        nx.set_node_attributes(ceg, {"w1": 2, "w2": 2, "w3": 2}, "stage")
         ceg._merge_nodes([("w1", "w2"), ("w1", "w3"), ("w2", "w3")])
         nodes_post_merge = set(ceg.nodes)
         merged_node = nodes_post_merge.intersection(nodes_to_merge).pop()
@@ -384,10 +354,11 @@ class TestNodesCanBeMerged(unittest.TestCase):
             ("w5", "w_infinity", "g"),
         ]
 
+        actual_edges = set(ceg.edges)
         for edge in expected_edges:
-            self.assertIn(edge, list(ceg.edges))
+            assert edge in actual_edges, f"Edge not found: {edge}"
 
-        self.assertEqual(len(list(ceg.edges)), len(expected_edges))
+        assert ceg.number_of_edges() == len(expected_edges)
 
 
 class TestTrimLeavesFromGraph(unittest.TestCase):
@@ -395,7 +366,6 @@ class TestTrimLeavesFromGraph(unittest.TestCase):
 
     def setUp(self):
         self.graph = nx.MultiDiGraph()
-        self.init_nodes = ["w0", "w1", "w2", "w3", "w4"]
         self.init_edges = [
             ("w0", "w1", "a"),
             ("w0", "w2", "b"),
@@ -406,22 +376,25 @@ class TestTrimLeavesFromGraph(unittest.TestCase):
         ]
         self.graph.root = "w0"
         self.leaves = ["w3", "w4"]
-        self.graph.add_nodes_from(self.init_nodes)
         self.graph.add_edges_from(self.init_edges)
         self.ceg = ChainEventGraph(self.graph, generate=False)
 
     def test_leaves_trimmed_from_graph(self) -> None:
         """Leaves are trimmed from the graph."""
         self.ceg._trim_leaves_from_graph()
-        for leaf in self.leaves:
-            self.assertIsNone(self.ceg.nodes.get(leaf), "Leaf was not removed.")
-
-            for edge_list_key in self.ceg.edges.keys():
-                self.assertNotEqual(
-                    edge_list_key[1],
-                    leaf,
-                    msg=f"Edge still pointing to leaf: {leaf}",
-                )
+        leaves = set(self.leaves)
+        for leaf in leaves:
+            self.assertNotIn(leaf, self.ceg, "Leaf was not removed.")
+
+        edges_to_leaves = {
+            (src, dst, key)
+            for src, dst, key in self.ceg.edges(keys=True)
+            if dst in leaves
+        }
+        self.assertFalse(
+            edges_to_leaves,
+            f"Edges still pointing to leaves: {edges_to_leaves}",
+        )
 
         expected_edges = [
             ("w0", "w1", "a"),
@@ -431,15 +404,16 @@ class TestTrimLeavesFromGraph(unittest.TestCase):
             ("w2", self.ceg.sink, "c"),
             ("w2", self.ceg.sink, "d"),
         ]
+        actual_edges = set(self.ceg.edges)
         for edge in expected_edges:
             self.assertIn(
                 edge,
-                list(self.ceg.edges),
+                actual_edges,
                 msg=f"Edge not found: {edge}",
             )
 
         self.assertEqual(
-            len(list(self.ceg.edges)),
+            self.ceg.number_of_edges(),
             len(expected_edges),
             "Wrong number of edges.",
         )
@@ -454,7 +428,6 @@ class TestPathList:
     def test_path_list_generation(self):
         """Path list is generated correctly."""
 
-        init_nodes = ["w0", "w1", "w2", "w3", "w4", "w5", "w_infinity"]
         init_edges = [
             ("w0", "w1", "a"),
             ("w0", "w2", "b"),
@@ -466,7 +439,6 @@ class TestPathList:
             ("w5", "w_infinity", "d"),
         ]
         self.graph.root = "w0"
-        self.graph.add_nodes_from(init_nodes)
         self.graph.add_edges_from(init_edges)
         ceg = ChainEventGraph(self.graph, generate=False)
         actual_path_list = ceg.path_list
@@ -493,7 +465,6 @@ class TestDistanceToSink(unittest.TestCase):
 
     def setUp(self):
         self.graph = nx.MultiDiGraph()
-        self.init_nodes = ["w0", "w1", "w2", "w3", "w4", "w5", "w_infinity"]
         self.init_edges = [
             ("w0", "w1", "a"),
             ("w0", "w2", "b"),
@@ -504,7 +475,6 @@ class TestDistanceToSink(unittest.TestCase):
             ("w4", "w5", "c"),
             ("w5", "w_infinity", "d"),
         ]
-        self.graph.add_nodes_from(self.init_nodes)
         self.graph.add_edges_from(self.init_edges)
         self.graph.root = "w0"
         self.ceg = ChainEventGraph(self.graph, generate=False)
@@ -513,9 +483,8 @@ class TestDistanceToSink(unittest.TestCase):
         """Distance to sink is always max length of paths to sink."""
 
         def check_distances():
-            actual_node_dists = nx.get_node_attributes(self.ceg, "max_dist_to_sink")
-            for node, distance in actual_node_dists.items():
-                assert distance == expected_node_dists[node]
+            for node, expected in expected_node_dists.items():
+                assert self.ceg.nodes[node]["max_dist_to_sink"] == expected
 
         expected_node_dists = {
             "w0": 4,
@@ -536,6 +505,38 @@ class TestDistanceToSink(unittest.TestCase):
         self.ceg._update_distances_to_sink()
         check_distances()
 
+    def test_update_distances_on_larger_dags(self) -> None:
+        """Distances match a brute-force longest path on random DAGs."""
+        rng = random.Random(42)
+        for num_nodes in (20, 50, 100):
+            graph = nx.MultiDiGraph()
+            # Edges only go from lower to higher numbered nodes,
+            # so the graph is guaranteed to be a DAG.
+            for src in range(num_nodes):
+                for dst in range(src + 1, num_nodes):
+                    if rng.random() < 0.1:
+                        graph.add_edge(f"w{src}", f"w{dst}")
+            graph.add_nodes_from([f"w{node}" for node in range(num_nodes)])
+            for node in list(graph.nodes):
+                if not graph.out_degree(node):
+                    graph.add_edge(node, "w_infinity")
+            graph.root = "w0"
+            ceg = ChainEventGraph(graph, generate=False)
+            ceg._update_distances_to_sink()
+
+            expected_dists = {ceg.sink: 0}
+            for node in reversed(list(nx.topological_sort(ceg))):
+                if node != ceg.sink:
+                    expected_dists[node] = 1 + max(
+                        expected_dists[succ] for succ in ceg.successors(node)
+                    )
+            for node, expected in expected_dists.items():
+                self.assertEqual(
+                    ceg.nodes[node]["max_dist_to_sink"],
+                    expected,
+                    f"Wrong distance for {node}.",
+                )
+
     def test_gen_nodes_with_increasing_distance(self) -> None:
         """Tests generate_nodes_with_increasing_distance"""
         expected_nodes = {
@@ -545,9 +546,11 @@ class TestDistanceToSink(unittest.TestCase):
             3: ["w1"],
             4: [self.ceg.root],
         }
-        for dist, nodes in expected_nodes.items():
-            for node in nodes:
-                self.ceg.nodes[node]["max_dist_to_sink"] = dist
+        nx.set_node_attributes(
+            self.ceg,
+            {node: dist for dist, nodes in expected_nodes.items() for node in nodes},
+            name="max_dist_to_sink",
+        )
 
         nodes_gen = self.ceg._gen_nodes_with_increasing_distance(start=0)
 
@@ -567,21 +570,6 @@ class TestGenerate(unittest.TestCase):
 
     def setUp(self) -> None:
         self.graph = nx.MultiDiGraph()
-        self.init_nodes = [
-            "s0",
-            "s1",
-            "s2",
-            "s3",
-            "s4",
-            "s5",
-            "s6",
-            "s7",
-            "s8",
-            "s9",
-            "s10",
-            "s11",
-            "s12",
-        ]
         self.init_edges = [
             ("s0", "s1", "a"),
             ("s0", "s2", "b"),
@@ -596,7 +584,6 @@ class TestGenerate(unittest.TestCase):
             ("s4", "s11", "k"),
             ("s0", "s12", "l"),
         ]
-        self.graph.add_nodes_from(self.init_nodes)
         self.graph.add_edges_from(self.init_edges)
         self.graph.root = "s0"
         self.graph.ahc_output = {
@@ -662,21 +649,6 @@ class TestBackwardsConstruction(unittest.TestCase):
         nodes to process
         """
         graph = nx.MultiDiGraph()
-        init_nodes = [
-            "w0",
-            "w1",
-            "w2",
-            "w3",
-            "w4",
-            "w5",
-            "w6",
-            "w7",
-            "w8",
-            "w9",
-            "w10",
-            "w11",
-            "w12",
-        ]
         init_edges = [
             ("w0", "w1", "a"),
             ("w0", "w2", "b"),
@@ -691,7 +663,6 @@ class TestBackwardsConstruction(unittest.TestCase):
             ("w4", "w11", "k"),
             ("w0", "w12", "l"),
         ]
-        graph.add_nodes_from(init_nodes)
         graph.add_edges_from(init_edges)
         graph.root = "w0"
         graph.ahc_output = {
@@ -705,7 +676,6 @@ class TestBackwardsConstruction(unittest.TestCase):
     def test_backwards_construction_produces_ceg(self):
         """The backwards construction algorithm takes the staged tree and
         makes the ceg."""
-        nodes = ["w0", "s1", "s2", "s3", "s4", "s5", "s11", "s12", "s13", "w_infinity"]
         edges = [
             ("w0", "s1", "hospital"),
             ("w0", "s2", "community"),
@@ -727,7 +697,6 @@ class TestBackwardsConstruction(unittest.TestCase):
             ("s13", "w_infinity", "recovery"),
         ]
         graph = nx.MultiDiGraph()
-        graph.add_nodes_from(nodes)
         graph.add_edges_from(edges)
         graph.root = "w0"
         graph.nodes["w0"]["stage"] = 0
@@ -8,6 +8,9 @@ import pytest
 import pandas as pd
 from pydotplus.graphviz import InvocationException
 from cegpy import EventTree
+from tests.conftest import load_dataframe
+
+_NODE_RE = re.compile(r"^s\d+$")
 
 
 class TestEventTreeAPI(unittest.TestCase):
@@ -19,7 +22,7 @@ class TestEventTreeAPI(unittest.TestCase):
             .resolve()
             .parent.parent.joinpath("../data/medical_dm_modified.xlsx")
         )
-        self.dataframe = pd.read_excel(df_path)
+        self.dataframe = load_dataframe(df_path)
 
     def test_required_argument_missing_fails(self):
         """No arguments raises TypeError"""
@@ -39,19 +42,24 @@ class TestEventTreeAPI(unittest.TestCase):
 
 
 class TestEventTree(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
+        """Reads the spreadsheet once for the whole class."""
         df_path = (
             Path(__file__)
             .resolve()
             .parent.parent.joinpath("../data/medical_dm_modified.xlsx")
         )
 
-        self.df = pd.read_excel(df_path)
+        cls._df = load_dataframe(df_path)
+
+    def setUp(self):
+        self.df = self._df.copy()
         self.et = EventTree(dataframe=self.df)
         self.reordered_et = EventTree(
             dataframe=self.df, var_order=self.df.columns[::-1]
         )
-        self.node_format = re.compile("^s\\d\\d*$")
+        self.node_format = _NODE_RE
 
     def test_check_sampling_zero_paths_param(self) -> None:
         """Tests the function that is checking the sampling zero paths param"""
@@ -86,8 +94,7 @@ class TestEventTree(unittest.TestCase):
         # code being tested:
         node_list = self.et._create_node_list_from_paths(paths)
 
-        print(node_list)
-        assert len(list(paths.keys())) + 1 == len(node_list)
+        assert len(paths) + 1 == len(node_list)
         assert node_list[0] == "s0"
         assert node_list[-1] == "s%d" % (len(node_list) - 1)
 
@@ -104,21 +111,19 @@ class TestEventTree(unittest.TestCase):
             assert isinstance(count, int)
 
     def test_get_functions_producing_expected_data(self) -> None:
-        edges = list(self.et.edges)
-        assert isinstance(edges, list)
-        for edge in edges:
+        for edge in self.et.edges:
             assert isinstance(edge, tuple)
             assert len(edge) == 3
             assert isinstance(edge[0], str)
             assert isinstance(edge[1], str)
             assert isinstance(edge[2], str)
 
-        check_list_contains_strings(list(self.et))
+        for node in self.et:
+            assert isinstance(node, str)
         check_list_contains_strings(self.et.situations)
         check_list_contains_strings(self.et.leaves)
 
         edge_counts = self.et.edge_counts
-        print(edge_counts)
         assert isinstance(edge_counts, dict)
         for edge, count in edge_counts.items():
             assert isinstance(edge, tuple)
@@ -149,25 +154,32 @@ class TestEventTree(unittest.TestCase):
 
 
 class TestIntegration(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
+        """Reads both spreadsheets once for the whole class."""
         # stratified dataset
         med_df_path = (
             Path(__file__)
             .resolve()
             .parent.parent.joinpath("../data/medical_dm_modified.xlsx")
         )
-        self.med_s_z_paths = None
-        self.med_df = pd.read_excel(med_df_path)
-        self.med_et = EventTree(
-            dataframe=self.med_df, sampling_zero_paths=self.med_s_z_paths
-        )
+        cls._med_df = load_dataframe(med_df_path)
 
         # non-stratified dataset
         fall_df_path = (
             Path(__file__).resolve().parent.parent.joinpath("../data/Falls_Data.xlsx")
         )
+        cls._fall_df = load_dataframe(fall_df_path)
+
+    def setUp(self):
+        self.med_s_z_paths = None
+        self.med_df = self._med_df.copy()
+        self.med_et = EventTree(
+            dataframe=self.med_df, sampling_zero_paths=self.med_s_z_paths
+        )
+
         self.fall_s_z_paths = None
-        self.fall_df = pd.read_excel(fall_df_path)
+        self.fall_df = self._fall_df.copy()
         self.fall_et = EventTree(
             dataframe=self.fall_df, sampling_zero_paths=self.fall_s_z_paths
         )
@@ -207,7 +219,7 @@ class TestUsecase(unittest.TestCase):
             .parent.parent.joinpath("../data/medical_dm_modified.xlsx")
         )
         self.med_s_z_paths = None
-        self.med_df = pd.read_excel(med_df_path)
+        self.med_df = load_dataframe(med_df_path)
         self.med_et = EventTree(
             dataframe=self.med_df, sampling_zero_paths=self.med_s_z_paths
         )
@@ -217,7 +229,7 @@ class TestUsecase(unittest.TestCase):
             Path(__file__).resolve().parent.parent.joinpath("../data/Falls_Data.xlsx")
         )
         self.fall_s_z_paths = None
-        self.fall_df = pd.read_excel(fall_df_path)
+        self.fall_df = load_dataframe(fall_df_path)
         self.fall_et = EventTree(dataframe=self.fall_df)
 
     def test_fall_cats_per_var(self):
@@ -241,7 +253,7 @@ class TestChangingDataFrame:
             .parent.parent.joinpath("../data/medical_dm_modified.xlsx")
         )
 
-        return pd.read_excel(med_df_path)
+        return load_dataframe(med_df_path)
 
     @pytest.fixture
     def med_et(self, med_df):
@@ -255,7 +267,7 @@ class TestChangingDataFrame:
         fall_df_path = (
             Path(__file__).resolve().parent.parent.joinpath("../data/Falls_Data.xlsx")
         )
-        return pd.read_excel(fall_df_path)
+        return load_dataframe(fall_df_path)
 
     @pytest.fixture
     def fall_et(self, fall_df):